@@ -2,6 +2,7 @@ from telegram import Update, InlineKeyboardButton, InlineKeyboardMarkup
 from telegram.ext import Application, CommandHandler, CallbackQueryHandler, MessageHandler, filters, ContextTypes
 from database import Database
 from stats import Stats
+from utils import related_article_ids
 import logging
 import os
 import sqlite3
@@ -14,6 +15,7 @@ class TrafficRulesBot:
         self.stats = Stats()
         self.token = token
         self.admin_id = admin_id
+        self.link_graph = self.db.get_link_graph()
         self.app = Application.builder().token(token).build()
         self.setup_handlers()
 
@@ -27,6 +29,13 @@ class TrafficRulesBot:
         self.app.add_handler(MessageHandler(filters.TEXT & ~filters.COMMAND, self.handle_text))
         self.app.add_handler(CallbackQueryHandler(self.button))
 
+    def related_buttons(self, article_id, limit=5):
+        if self.db.get_articles_version() != self.link_graph['version']:
+            self.link_graph = self.db.get_link_graph()
+        numbers = self.link_graph['numbers']
+        return [[InlineKeyboardButton(f"↪ {numbers[t]}", callback_data=f'article_{t}')]
+                for t in related_article_ids(self.link_graph, article_id, limit)]
+
     async def start(self, update: Update, context: ContextTypes.DEFAULT_TYPE):
         self.db.log_action(update.effective_user.id, 'start')
         keyboard = [
@@ -117,14 +126,16 @@ class TrafficRulesBot:
         next_id = cursor.fetchone()
         conn.close()
 
-        keyboard = []
+        navigation = []
         if prev_id:
-            keyboard.append(InlineKeyboardButton("Назад", callback_data=f'article_{prev_id[0]}'))
+            navigation.append(InlineKeyboardButton("Назад", callback_data=f'article_{prev_id[0]}'))
         if next_id:
-            keyboard.append(InlineKeyboardButton("Вперед", callback_data=f'article_{next_id[0]}'))
+            navigation.append(InlineKeyboardButton("Вперед", callback_data=f'article_{next_id[0]}'))
+        keyboard = [navigation] if navigation else []
+        keyboard.extend(self.related_buttons(article['id']))
         keyboard.append([InlineKeyboardButton("Розділи", callback_data='sections')])
         keyboard.append([InlineKeyboardButton("Партнери", callback_data='partners')])
-        reply_markup = InlineKeyboardMarkup([keyboard])
+        reply_markup = InlineKeyboardMarkup(keyboard)
 
         text = f"{article['section']}\n{article['number']}\n{article['text']}"
         self.db.log_action(update.effective_user.id, 'view_article', article_id=article['id'])
@@ -181,14 +192,16 @@ class TrafficRulesBot:
             next_id = cursor.fetchone()
             conn.close()
 
-            keyboard = []
+            navigation = []
             if prev_id:
-                keyboard.append(InlineKeyboardButton("Назад", callback_data=f'article_{prev_id[0]}'))
+                navigation.append(InlineKeyboardButton("Назад", callback_data=f'article_{prev_id[0]}'))
             if next_id:
-                keyboard.append(InlineKeyboardButton("Вперед", callback_data=f'article_{next_id[0]}'))
+                navigation.append(InlineKeyboardButton("Вперед", callback_data=f'article_{next_id[0]}'))
+            keyboard = [navigation] if navigation else []
+            keyboard.extend(self.related_buttons(article_id))
             keyboard.append([InlineKeyboardButton("Розділи", callback_data='sections')])
             keyboard.append([InlineKeyboardButton("Партнери", callback_data='partners')])
-            reply_markup = InlineKeyboardMarkup([keyboard])
+            reply_markup = InlineKeyboardMarkup(keyboard)
 
             text = f"{article[4]}\n{article[1]}\n{article[3]}"
             self.db.log_action(update.effective_user.id, 'view_article', article_id=article_id)
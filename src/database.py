@@ -1,6 +1,7 @@
 import sqlite3
 from datetime import datetime, timedelta
 import logging
+from utils import LINK_TABLES_SQL
 
 logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
 
@@ -39,6 +40,8 @@ class Database:
                 content TEXT NOT NULL
             )
         ''')
+        for statement in LINK_TABLES_SQL:
+            cursor.execute(statement)
         cursor.execute('INSERT OR IGNORE INTO partners (id, content) VALUES (1, ?)', 
                       ('Приєднуйтесь до нашого каналу: t.me/example',))
         conn.commit()
@@ -59,13 +62,15 @@ class Database:
                 return [{'id': result[0], 'number': result[1], 'title': result[2], 
                          'text': result[3], 'section': result[4]}]
             
+            # rank у FTS5 від'ємний: що більше вхідних посилань, то вище стаття
             cursor.execute('''
                 SELECT a.id, a.number, a.title, a.text, s.name
                 FROM articles_fts fts
                 JOIN articles a ON fts.rowid = a.id
                 JOIN sections s ON a.section_id = s.id
+                LEFT JOIN article_link_counts c ON c.article_id = a.id
                 WHERE articles_fts MATCH ?
-                ORDER BY rank
+                ORDER BY rank * (1 + 0.1 * COALESCE(c.incoming_count, 0))
             ''', (query,))
             results = cursor.fetchall()
             return [{'id': r[0], 'number': r[1], 'title': r[2], 'text': r[3], 'section': r[4]} 
@@ -73,6 +78,44 @@ class Database:
         finally:
             conn.close()
 
+    def get_articles_version(self):
+        # Парсер перевставляє всі статті з AUTOINCREMENT, тож MAX(id) змінюється після кожного парсингу
+        conn = sqlite3.connect(self.db_path)
+        cursor = conn.cursor()
+        try:
+            cursor.execute('SELECT MAX(id) FROM articles')
+            return cursor.fetchone()[0]
+        except sqlite3.OperationalError:
+            return None
+        finally:
+            conn.close()
+
+    def get_link_graph(self):
+        conn = sqlite3.connect(self.db_path)
+        cursor = conn.cursor()
+        graph = {'version': None, 'outgoing': {}, 'incoming': {}, 'numbers': {}}
+        try:
+            cursor.execute('SELECT MAX(id) FROM articles')
+            graph['version'] = cursor.fetchone()[0]
+            cursor.execute('''
+                SELECT l.source_id, l.target_id, src.number, dst.number
+                FROM article_links l
+                JOIN articles src ON l.source_id = src.id
+                JOIN articles dst ON l.target_id = dst.id
+                ORDER BY l.source_id, l.target_id
+            ''')
+            for source_id, target_id, source_number, target_number in cursor.fetchall():
+                graph['outgoing'].setdefault(source_id, []).append(target_id)
+                graph['incoming'].setdefault(target_id, []).append(source_id)
+                graph['numbers'][source_id] = source_number
+                graph['numbers'][target_id] = target_number
+            return graph
+        except sqlite3.OperationalError as e:
+            logging.warning(f"Граф посилань недоступний: {str(e)}")
+            return graph
+        finally:
+            conn.close()
+
     def log_action(self, user_id, action, article_id=None, query=None):
         conn = sqlite3.connect(self.db_path)
         cursor = conn.cursor()
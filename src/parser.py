@@ -2,6 +2,7 @@ import requests
 from bs4 import BeautifulSoup
 import sqlite3
 import logging
+from utils import LINK_TABLES_SQL, build_links, leading_number
 
 logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
 
@@ -25,6 +26,8 @@ def init_db():
             FOREIGN KEY (section_id) REFERENCES sections(id)
         )
     ''')
+    for statement in LINK_TABLES_SQL:
+        cursor.execute(statement)
     cursor.execute('''
         CREATE VIRTUAL TABLE IF NOT EXISTS articles_fts USING fts5(
             number, title, text, content='articles', content_rowid='id'
@@ -37,6 +40,8 @@ def parse_traffic_rules(url):
     try:
         conn, cursor = init_db()
         
+        cursor.execute('DELETE FROM article_link_counts')
+        cursor.execute('DELETE FROM article_links')
         cursor.execute('DELETE FROM articles_fts')
         cursor.execute('DELETE FROM articles')
         cursor.execute('DELETE FROM sections')
@@ -54,12 +59,16 @@ def parse_traffic_rules(url):
         current_section = None
         current_section_id = None
         articles = []
+        section_numbers = {}
 
         for element in content.find_all(['h2', 'h3', 'p']):
             if element.name == 'h2':
                 current_section = element.get_text(strip=True)
                 cursor.execute('INSERT OR REPLACE INTO sections (name) VALUES (?)', (current_section,))
                 current_section_id = cursor.lastrowid
+                section_number = leading_number(current_section)
+                if section_number:
+                    section_numbers[section_number] = current_section_id
             elif element.name == 'h3' and current_section_id:
                 article_number = element.get_text(strip=True)
                 article = {
@@ -82,9 +91,17 @@ def parse_traffic_rules(url):
                 INSERT INTO articles_fts (rowid, number, title, text)
                 VALUES (?, ?, ?, ?)
             ''', (article_id, article['number'], article['title'], article['text'].strip()))
-        
+            article['id'] = article_id
+
+        links = build_links(articles, section_numbers)
+        cursor.executemany('INSERT OR IGNORE INTO article_links (source_id, target_id) VALUES (?, ?)', links)
+        cursor.execute('''
+            INSERT INTO article_link_counts (article_id, incoming_count)
+            SELECT target_id, COUNT(*) FROM article_links GROUP BY target_id
+        ''')
+
         conn.commit()
-        logging.info(f"Успішно спарсено та збережено {len(articles)} статей")
+        logging.info(f"Успішно спарсено та збережено {len(articles)} статей, {len(links)} посилань")
         
     except Exception as e:
         logging.error(f"Помилка парсингу: {str(e)}")
@@ -1,2 +1,97 @@
 # src/utils.py
-pass
\ No newline at end of file
+import re
+
+NUMBER = r'\d+(?:\.\d+)*'
+SEPARATOR = r'\s*(?:,|\bі\b|\bта\b|\bабо\b|[–—-])\s*'
+POINT_REF_RE = re.compile(
+    r'(?:пункт\w*|\bп\.)\s*(\d+(?:\.\d+)+(?:' + SEPARATOR + r'\d+(?:\.\d+)+)*)', re.IGNORECASE)
+# Номер розділу не може бути продовжений крапкою: "розділі 2.3" — це пункт, а не розділ 2
+SECTION_NUMBER = r'\d+(?!\d|\.\d)'
+SECTION_REF_RE = re.compile(
+    r'розділ\w*\s*(' + SECTION_NUMBER + r'(?:' + SEPARATOR + SECTION_NUMBER + r')*)', re.IGNORECASE)
+TOKEN_RE = re.compile(NUMBER + r'|[–—-]')
+NUMBER_RE = re.compile(NUMBER)
+
+LINK_TABLES_SQL = [
+    '''
+    CREATE TABLE IF NOT EXISTS article_links (
+        source_id INTEGER NOT NULL,
+        target_id INTEGER NOT NULL,
+        PRIMARY KEY (source_id, target_id),
+        FOREIGN KEY (source_id) REFERENCES articles(id),
+        FOREIGN KEY (target_id) REFERENCES articles(id)
+    )
+    ''',
+    '''
+    CREATE INDEX IF NOT EXISTS idx_article_links_target ON article_links(target_id)
+    ''',
+    '''
+    CREATE TABLE IF NOT EXISTS article_link_counts (
+        article_id INTEGER PRIMARY KEY,
+        incoming_count INTEGER NOT NULL,
+        FOREIGN KEY (article_id) REFERENCES articles(id)
+    )
+    ''',
+]
+
+def split_references(run):
+    # "10.1–10.3" розгортаємо в 10.1, 10.2, 10.3, якщо межі мають спільного батька
+    numbers = []
+    is_range = False
+    for token in TOKEN_RE.findall(run):
+        if token in '–—-':
+            is_range = True
+            continue
+        if is_range and numbers:
+            start_prefix, _, start_last = numbers[-1].rpartition('.')
+            end_prefix, _, end_last = token.rpartition('.')
+            if start_prefix == end_prefix and int(start_last) < int(end_last):
+                prefix = f"{start_prefix}." if start_prefix else ''
+                numbers += [f"{prefix}{n}" for n in range(int(start_last) + 1, int(end_last))]
+        numbers.append(token)
+        is_range = False
+    return numbers
+
+def extract_references(text):
+    points = [p for run in POINT_REF_RE.findall(text) for p in split_references(run)]
+    sections = [s for run in SECTION_REF_RE.findall(text) for s in split_references(run)]
+    return points, sections
+
+def leading_number(label):
+    match = NUMBER_RE.search(label)
+    return match.group(0) if match else None
+
+def resolve_point(number, by_number):
+    # Підпункт, якого немає серед статей, зводимо до батьківського пункту
+    while number not in by_number and '.' in number:
+        number = number.rsplit('.', 1)[0]
+    return by_number.get(number)
+
+def build_links(articles, section_numbers):
+    # Посилання на розділ ведуть на першу статтю цього розділу
+    by_number = {}
+    first_in_section = {}
+    for article in articles:
+        number = leading_number(article['number'])
+        if number:
+            by_number.setdefault(number, article['id'])
+        first_in_section.setdefault(article['section_id'], article['id'])
+
+    links = set()
+    for article in articles:
+        points, sections = extract_references(article['text'])
+        targets = [resolve_point(p, by_number) for p in points]
+        targets += [first_in_section.get(section_numbers.get(s)) for s in sections]
+        for target_id in targets:
+            if target_id and target_id != article['id']:
+                links.add((article['id'], target_id))
+    return sorted(links)
+
+def related_article_ids(graph, article_id, limit=5):
+    # Спершу статті, на які посилається ця, потім ті, що посилаються на неї
+    related = graph['outgoing'].get(article_id, []) + graph['incoming'].get(article_id, [])
+    seen = []
+    for target_id in related:
+        if target_id not in seen:
+            seen.append(target_id)
+    return seen[:limit]
@@ -0,0 +1,86 @@
+import os
+import sqlite3
+import sys
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+from database import Database
+
+def create_articles_db(path):
+    # Схема бази, збудованої парсером до появи таблиць посилань
+    conn = sqlite3.connect(path)
+    conn.executescript('''
+        CREATE TABLE sections (id INTEGER PRIMARY KEY AUTOINCREMENT, name TEXT NOT NULL);
+        CREATE TABLE articles (
+            id INTEGER PRIMARY KEY AUTOINCREMENT,
+            section_id INTEGER,
+            number TEXT NOT NULL,
+            title TEXT NOT NULL,
+            text TEXT NOT NULL
+        );
+        CREATE VIRTUAL TABLE articles_fts USING fts5(
+            number, title, text, content='articles', content_rowid='id'
+        );
+        INSERT INTO sections (id, name) VALUES (1, '1. Загальні положення');
+        INSERT INTO articles (id, section_id, number, title, text) VALUES
+            (1, 1, '1.1', '1.1', 'водій зобовʼязаний'),
+            (2, 1, '1.2', '1.2', 'водій повинен'),
+            (3, 1, '1.3', '1.3', 'водій має');
+        INSERT INTO articles_fts (rowid, number, title, text)
+            SELECT id, number, title, text FROM articles;
+    ''')
+    conn.commit()
+    conn.close()
+
+def add_links(path, links):
+    conn = sqlite3.connect(path)
+    conn.executemany('INSERT INTO article_links (source_id, target_id) VALUES (?, ?)', links)
+    conn.execute('''
+        INSERT INTO article_link_counts (article_id, incoming_count)
+        SELECT target_id, COUNT(*) FROM article_links GROUP BY target_id
+    ''')
+    conn.commit()
+    conn.close()
+
+def test_search_on_database_without_link_tables(tmp_path):
+    path = str(tmp_path / 'PDR.db')
+    create_articles_db(path)
+    db = Database(path)
+    assert {r['number'] for r in db.search_articles('водій')} == {'1.1', '1.2', '1.3'}
+    assert db.get_link_graph()['outgoing'] == {}
+
+def test_search_boosts_articles_with_incoming_links(tmp_path):
+    path = str(tmp_path / 'PDR.db')
+    create_articles_db(path)
+    db = Database(path)
+    add_links(path, [(1, 3), (2, 3)])
+    assert db.search_articles('водій')[0]['number'] == '1.3'
+
+def test_get_link_graph(tmp_path):
+    path = str(tmp_path / 'PDR.db')
+    create_articles_db(path)
+    db = Database(path)
+    add_links(path, [(1, 3), (2, 3)])
+    graph = db.get_link_graph()
+    assert graph['outgoing'] == {1: [3], 2: [3]}
+    assert graph['incoming'] == {3: [1, 2]}
+    assert graph['numbers'] == {1: '1.1', 2: '1.2', 3: '1.3'}
+    assert graph['version'] == db.get_articles_version() == 3
+
+def test_get_link_graph_without_articles_table(tmp_path):
+    db = Database(str(tmp_path / 'PDR.db'))
+    graph = db.get_link_graph()
+    assert graph == {'version': None, 'outgoing': {}, 'incoming': {}, 'numbers': {}}
+    assert db.get_articles_version() is None
+
+def test_articles_version_changes_after_reparse(tmp_path):
+    path = str(tmp_path / 'PDR.db')
+    create_articles_db(path)
+    db = Database(path)
+    version = db.get_articles_version()
+    conn = sqlite3.connect(path)
+    conn.execute('DELETE FROM articles')
+    conn.execute("INSERT INTO articles (section_id, number, title, text) VALUES (1, '1.1', '1.1', 'водій')")
+    conn.commit()
+    conn.close()
+    assert db.get_articles_version() != version
@@ -0,0 +1,65 @@
+import os
+import sys
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+from utils import build_links, extract_references, related_article_ids
+
+def article(id, section_id, number, text=''):
+    return {'id': id, 'section_id': section_id, 'number': number, 'title': number, 'text': text}
+
+def test_plain_reference():
+    articles = [article(1, 1, '2.3'), article(2, 1, '2.4', 'згідно з пунктом 2.3')]
+    assert build_links(articles, {}) == [(2, 1)]
+
+def test_subpoint_falls_back_to_parent():
+    articles = [article(1, 1, '4.2'), article(2, 1, '4.3', 'відповідно до підпункту 4.2.1')]
+    assert build_links(articles, {}) == [(2, 1)]
+
+def test_section_reference_links_first_article():
+    articles = [
+        article(1, 1, '1.1', 'див. розділ 33'),
+        article(2, 33, '33.1'),
+        article(3, 33, '33.2'),
+    ]
+    assert build_links(articles, {'1': 1, '33': 33}) == [(1, 2)]
+
+def test_dotted_number_is_not_section_reference():
+    articles = [
+        article(1, 1, '1.1', 'у розділі 2.3'),
+        article(2, 2, '2.1'),
+        article(3, 2, '2.3'),
+    ]
+    assert extract_references('у розділі 2.3') == ([], [])
+    assert build_links(articles, {'1': 1, '2': 2}) == []
+
+def test_self_reference_dropped():
+    articles = [article(1, 1, '2.3', 'вимоги пункту 2.3')]
+    assert build_links(articles, {}) == []
+
+def test_list_of_points():
+    articles = [
+        article(1, 1, '2.4'),
+        article(2, 1, '2.5'),
+        article(3, 1, '2.6'),
+        article(4, 1, '2.7', 'пунктами 2.4 і 2.5, 2.6'),
+    ]
+    assert build_links(articles, {}) == [(4, 1), (4, 2), (4, 3)]
+
+def test_range_of_points():
+    articles = [
+        article(1, 10, '10.1'),
+        article(2, 10, '10.2'),
+        article(3, 10, '10.3'),
+        article(4, 11, '11.1', 'вимоги пунктів 10.1–10.3'),
+    ]
+    assert build_links(articles, {}) == [(4, 1), (4, 2), (4, 3)]
+
+def test_abbreviation_requires_word_boundary():
+    assert extract_references('ліп. 2.3 та п. 2.4') == (['2.4'], [])
+
+def test_related_article_ids_deduplicates_and_limits():
+    graph = {'outgoing': {1: [2, 3, 4]}, 'incoming': {1: [3, 5, 6, 7]}}
+    assert related_article_ids(graph, 1) == [2, 3, 4, 5, 6]
+    assert related_article_ids(graph, 1, limit=2) == [2, 3]
+    assert related_article_ids(graph, 9) == []